@@ -7,11 +7,14 @@ with JSON file-based persistence.
 """
 
 import asyncio
-import json
+import functools
+import mmap
 import os
+import sys
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, fields
 from pathlib import Path
 
 import mcp.types as types
@@ -20,133 +23,458 @@ from mcp.server.models import InitializationOptions
 from mcp.server.lowlevel import NotificationOptions
 import mcp.server.stdio
 
+# Pick the fastest available JSON implementation once, at import time.
+# Both variants produce and accept bytes, so callers never encode/decode.
+try:
+    import orjson
+    
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    def _loads(data) -> Any:
+        # json only takes str/bytes, so memory-mapped snapshots are copied here
+        return json.loads(bytes(data))
+
+
+def _format_ns(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp as a local ISO 8601 string"""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+
+def _parse_iso(value: str) -> int:
+    """Convert a local ISO 8601 string back to a nanosecond timestamp"""
+    dt = datetime.fromisoformat(value)
+    return int(dt.replace(microsecond=0).timestamp()) * 1_000_000_000 + dt.microsecond * 1000
+
 
 # Data Models
-@dataclass
+@dataclass(slots=True)
 class TodoItem:
     """Represents a single todo item"""
     id: int
     title: str
     description: str = ""
     completed: bool = False
-    created_at: str = ""
-    completed_at: Optional[str] = None
+    created_at_ns: int = 0
+    completed_at_ns: Optional[int] = None
     priority: str = "medium"  # low, medium, high
     
     def __post_init__(self):
-        if not self.created_at:
-            self.created_at = datetime.now().isoformat()
+        if not self.created_at_ns:
+            self.created_at_ns = time.time_ns()
+    
+    # Timestamps are kept as integers and only formatted when displayed
+    @property
+    def created_at(self) -> str:
+        """Creation time as an ISO 8601 string"""
+        return _format_ns(self.created_at_ns)
+    
+    @created_at.setter
+    def created_at(self, value: str):
+        self.created_at_ns = _parse_iso(value)
+    
+    @property
+    def completed_at(self) -> Optional[str]:
+        """Completion time as an ISO 8601 string, or None if not completed"""
+        if self.completed_at_ns is None:
+            return None
+        return _format_ns(self.completed_at_ns)
+    
+    @completed_at.setter
+    def completed_at(self, value: Optional[str]):
+        self.completed_at_ns = _parse_iso(value) if value else None
     
     def complete(self):
         """Mark the todo item as completed"""
         self.completed = True
-        self.completed_at = datetime.now().isoformat()
+        self.completed_at_ns = time.time_ns()
     
     def uncomplete(self):
         """Mark the todo item as not completed"""
         self.completed = False
-        self.completed_at = None
+        self.completed_at_ns = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TodoItem":
+        """Build a todo item from stored data, skipping __init__ and __post_init__"""
+        todo = cls.__new__(cls)
+        todo.id = data['id']
+        todo.title = data['title']
+        todo.description = data.get('description', "")
+        todo.completed = data.get('completed', False)
+        todo.created_at_ns = data.get('created_at_ns') or time.time_ns()
+        todo.completed_at_ns = data.get('completed_at_ns')
+        # Stores written before timestamps were kept as integers hold ISO strings
+        if data.get('created_at'):
+            todo.created_at = data['created_at']
+        if data.get('completed_at'):
+            todo.completed_at = data['completed_at']
+        todo.priority = data.get('priority', "medium")
+        return todo
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the todo item as a plain dict for serialization"""
+        return {name: getattr(self, name) for name in _TODO_FIELDS}
+
+
+# Field names in declaration order; unlike asdict() this avoids a fields() walk per call
+_TODO_FIELDS = tuple(f.name for f in fields(TodoItem))
 
 
 class TodoStorage:
-    """Handles persistent storage of todo items using JSON files"""
+    """Handles persistent storage of todo items using a JSON snapshot plus an append-only journal"""
     
-    def __init__(self, storage_path: Optional[str] = None):
+    # Journal size (in bytes) above which it is folded back into the snapshot
+    compact_threshold = 256 * 1024
+    # Buffered journal bytes that wake the background flusher early
+    max_pending_bytes = 64 * 1024
+    # Snapshots at least this large are memory-mapped rather than read into a copy
+    mmap_threshold = 4 * 1024
+    # Fields update_todo may change; the id keys the todo and completion has its own methods
+    editable_fields = frozenset({'title', 'description', 'priority'})
+    
+    def __init__(self, storage_path: Optional[str] = None, *, backend: Optional[Dict[str, Any]] = None):
         # Use environment variable if available, otherwise default
         if storage_path is None:
             storage_path = os.getenv('TODO_STORAGE_PATH', 'todos.json')
         
         self.storage_path = Path(storage_path)
+        # Append rather than swap the suffix, so the journal can never be the snapshot
+        # itself (todos.log) or shared by stores that differ only in extension
+        self.journal_path = self.storage_path.with_name(self.storage_path.name + '.log')
+        
+        # Optional in-memory stand-in for the files: the snapshot and journal bytes are kept
+        # under its 'snapshot' and 'journal' keys and nothing touches the disk
+        self._backend = backend
         
-        # Ensure the directory exists
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        if backend is None:
+            # Ensure the directory exists
+            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self.todos: List[TodoItem] = []
+        # Todos keyed by ID; dicts keep insertion order, so this is also the list order
+        self.todos: Dict[int, TodoItem] = {}
+        # get_all_todos() result, dropped whenever a todo is added or removed
+        self._all_cache: Optional[Tuple[TodoItem, ...]] = None
         self._next_id = 1
+        self._journal = None
+        self._journal_size = 0
+        
+        # Journal records waiting for the background flusher (see start_flusher)
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
         self.load()
     
     def load(self):
-        """Load todos from JSON file"""
+        """Load todos from the JSON snapshot and replay the journal on top of it"""
         try:
-            if self.storage_path.exists():
-                with open(self.storage_path, 'r') as f:
-                    data = json.load(f)
-                    self.todos = [TodoItem(**item) for item in data.get('todos', [])]
-                    self._next_id = data.get('next_id', 1)
+            data = self._read_snapshot()
+            if data is not None:
+                todos = (TodoItem.from_dict(item) for item in data.get('todos', []))
+                self.todos = {todo.id: todo for todo in todos}
+                self._next_id = data.get('next_id', 1)
             else:
-                self.todos = []
+                self.todos = {}
                 self._next_id = 1
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"Error loading todos: {e}")
-            self.todos = []
+        except (ValueError, KeyError) as e:
+            print(f"Error loading todos: {e}", file=sys.stderr)
+            self.todos = {}
             self._next_id = 1
+        self._replay_journal()
+        self._all_cache = None
+    
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Parse the JSON snapshot, memory-mapping the file when it is large"""
+        if self._backend is not None:
+            snapshot = self._backend.get('snapshot')
+            return None if snapshot is None else _loads(snapshot)
+        
+        if not self.storage_path.exists():
+            return None
+        with open(self.storage_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < self.mmap_threshold:
+                return _loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return _loads(view)
+    
+    def _replay_journal(self):
+        """Apply the mutations recorded in the journal since the last compaction"""
+        self._journal_size = 0
+        for line in self._read_journal():
+            try:
+                # A record only counts once its newline is written; otherwise the next
+                # append would be glued onto it
+                if not line.endswith(b'\n'):
+                    raise ValueError("incomplete journal record")
+                self._apply(_loads(line))
+            except (ValueError, KeyError, TypeError) as e:
+                # A torn record from an interrupted write: keep everything before it
+                # and cut it off so new records are not appended after garbage
+                print(f"Error replaying todo journal: {e}", file=sys.stderr)
+                self._truncate_journal(self._journal_size)
+                break
+            self._journal_size += len(line)
+    
+    def _read_journal(self) -> List[bytes]:
+        """Return the journal records, one line each"""
+        if self._backend is not None:
+            return self._backend.get('journal', b'').splitlines(keepends=True)
+        
+        if not self.journal_path.exists():
+            return []
+        with open(self.journal_path, 'rb') as f:
+            return f.readlines()
+    
+    def _truncate_journal(self, size: int):
+        """Cut the journal back to its first `size` bytes"""
+        if self._backend is not None:
+            del self._backend.setdefault('journal', bytearray())[size:]
+            return
+        
+        # The append handle uses O_APPEND, so it keeps writing at the new end
+        with open(self.journal_path, 'ab') as f:
+            f.truncate(size)
+    
+    def _apply(self, entry: Dict[str, Any]):
+        """Apply a single journal entry to the loaded todos"""
+        op = entry['op']
+        if op == 'add':
+            todo = TodoItem.from_dict(entry['todo'])
+            self.todos[todo.id] = todo
+            self._next_id = max(self._next_id, todo.id + 1)
+        elif op == 'update':
+            todo = self.todos.get(entry['id'])
+            if todo:
+                for key, value in entry['fields'].items():
+                    setattr(todo, key, value)
+        elif op == 'delete':
+            self.todos.pop(entry['id'], None)
+    
+    def _append(self, op: str, **payload):
+        """Append a single mutation record to the journal"""
+        self._append_records([_dumps({'op': op, **payload}) + b'\n'])
     
-    def save(self):
-        """Save todos to JSON file"""
+    def _append_records(self, records: List[bytes]):
+        """Append serialized mutation records to the journal in one write"""
+        if self._flush_task is not None:
+            # Leave the disk write to the background flusher
+            self._pending.extend(records)
+            self._pending_bytes += sum(map(len, records))
+            if self._pending_bytes >= self.max_pending_bytes:
+                self._flush_wakeup.set()
+            return
+        
+        self._write_journal(b''.join(records))
+        self._maybe_compact()
+    
+    def _write_journal(self, data: bytes):
+        """Write one or more serialized records to the journal"""
+        if self._backend is not None:
+            self._backend.setdefault('journal', bytearray()).extend(data)
+            self._journal_size += len(data)
+            return
+        
         try:
-            data = {
-                'todos': [asdict(todo) for todo in self.todos],
-                'next_id': self._next_id
-            }
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            if self._journal is None:
+                self._journal = open(self.journal_path, 'ab', buffering=0)
+            self._journal.write(data)
+            self._journal_size += len(data)
         except Exception as e:
-            print(f"Error saving todos: {e}")
+            print(f"Error saving todos: {e}", file=sys.stderr)
+    
+    def _maybe_compact(self):
+        """Compact the journal once it has grown past the threshold"""
+        if self._journal_size > self.compact_threshold:
+            self.compact()
+    
+    def _take_pending(self) -> bytes:
+        """Remove and return all buffered journal records as one chunk"""
+        data = b''.join(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+        return data
+    
+    def flush(self):
+        """Write any buffered journal records to the journal"""
+        if self._pending:
+            self._write_journal(self._take_pending())
+            self._maybe_compact()
+    
+    def start_flusher(self, interval: float = 0.1):
+        """Buffer journal writes and flush them from a background task every `interval` seconds"""
+        if self._flush_task is None:
+            self._stopping = False
+            self._flush_wakeup = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flusher(interval))
+    
+    async def _flusher(self, interval: float):
+        """Write buffered records off the event loop, coalescing bursts into one write"""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._flush_wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_wakeup.clear()
+            if self._pending:
+                await asyncio.to_thread(self._write_journal, self._take_pending())
+                self._maybe_compact()
+    
+    async def aclose(self):
+        """Stop the background flusher, write out anything pending and close the journal"""
+        if self._flush_task is not None:
+            # Let the flusher finish its current write rather than cancelling it mid-way
+            self._stopping = True
+            self._flush_wakeup.set()
+            await self._flush_task
+            self._flush_task = None
+        self.flush()
+        self.close()
+    
+    def compact(self):
+        """Write all todos to a fresh JSON snapshot and truncate the journal"""
+        try:
+            self._write_snapshot(self.to_bytes())
+            self._truncate_journal(0)
+            self._journal_size = 0
+        except Exception as e:
+            print(f"Error saving todos: {e}", file=sys.stderr)
+    
+    def to_bytes(self) -> bytes:
+        """Serialize all todos as a JSON snapshot"""
+        return _dumps({
+            'todos': [todo.to_dict() for todo in self.todos.values()],
+            'next_id': self._next_id
+        })
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'TodoStorage':
+        """Create an in-memory storage loaded from a to_bytes() snapshot"""
+        return cls(backend={'snapshot': data})
+    
+    def _write_snapshot(self, payload: bytes):
+        """Replace the snapshot with `payload`"""
+        if self._backend is not None:
+            self._backend['snapshot'] = payload
+            return
+        
+        # Write the whole snapshot aside and make it durable before swapping it in,
+        # so a crash never leaves a half-written todos file behind
+        tmp_path = self.storage_path.with_name(self.storage_path.name + '.tmp')
+        with open(tmp_path, 'wb', buffering=64 * 1024) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.storage_path)
+    
+    def close(self):
+        """Close the journal file handle"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
     
     def add_todo(self, title: str, description: str = "", priority: str = "medium") -> TodoItem:
         """Add a new todo item"""
-        todo = TodoItem(
-            id=self._next_id,
-            title=title,
-            description=description,
-            priority=priority
-        )
-        self.todos.append(todo)
-        self._next_id += 1
-        self.save()
+        todo = self._make_todo(self._next_id, title, description, priority)
+        self._insert([todo])
+        self._append('add', todo=todo.to_dict())
         return todo
     
+    def add_todos(self, specs: Iterable[tuple]) -> List[TodoItem]:
+        """Add several todo items, journaling them with a single write
+        
+        Each spec is a tuple of add_todo arguments: (title[, description[, priority]]).
+        All items are built before any is stored, so a bad spec adds nothing.
+        """
+        todos = [self._make_todo(self._next_id + i, *spec) for i, spec in enumerate(specs)]
+        if todos:
+            self._insert(todos)
+            self._append_records([
+                _dumps({'op': 'add', 'todo': todo.to_dict()}) + b'\n' for todo in todos
+            ])
+        return todos
+    
+    @staticmethod
+    def _make_todo(todo_id: int, title: str, description: str = "", priority: str = "medium") -> TodoItem:
+        """Build a todo item from add_todo-style arguments"""
+        return TodoItem(id=todo_id, title=title, description=description, priority=priority)
+    
+    def _insert(self, todos: List[TodoItem]):
+        """Store newly created todo items and advance the next ID past them"""
+        for todo in todos:
+            self.todos[todo.id] = todo
+        self._next_id = todos[-1].id + 1
+        self._all_cache = None
+    
     def get_todo(self, todo_id: int) -> Optional[TodoItem]:
         """Get a todo item by ID"""
-        return next((todo for todo in self.todos if todo.id == todo_id), None)
+        return self.todos.get(todo_id)
+    
+    def get_all_todos(self) -> Tuple[TodoItem, ...]:
+        """Get all todo items
+        
+        The tuple is cached until a todo is added or removed.
+        """
+        if self._all_cache is None:
+            self._all_cache = tuple(self.todos.values())
+        return self._all_cache
     
-    def get_all_todos(self) -> List[TodoItem]:
-        """Get all todo items"""
-        return self.todos.copy()
+    def iter_todos(self) -> Iterable[TodoItem]:
+        """Iterate over all todo items without copying them (read-only view)"""
+        return self.todos.values()
     
     def update_todo(self, todo_id: int, **kwargs) -> Optional[TodoItem]:
-        """Update a todo item"""
+        """Update a todo item's title, description and/or priority
+        
+        Other keyword arguments are ignored. A non-string value raises TypeError
+        before anything is changed.
+        """
         todo = self.get_todo(todo_id)
         if todo:
-            for key, value in kwargs.items():
-                if hasattr(todo, key):
+            updates = {key: value for key, value in kwargs.items() if key in self.editable_fields}
+            for key, value in updates.items():
+                if not isinstance(value, str):
+                    raise TypeError(f"{key} must be a string, not {type(value).__name__}")
+            
+            # Only journal fields whose value actually changes
+            changes = {key: value for key, value in updates.items() if getattr(todo, key) != value}
+            if changes:
+                for key, value in changes.items():
                     setattr(todo, key, value)
-            self.save()
+                self._append('update', id=todo_id, fields=changes)
         return todo
     
     def delete_todo(self, todo_id: int) -> bool:
         """Delete a todo item"""
-        todo = self.get_todo(todo_id)
-        if todo:
-            self.todos.remove(todo)
-            self.save()
+        if self.todos.pop(todo_id, None) is not None:
+            self._all_cache = None
+            self._append('delete', id=todo_id)
             return True
         return False
     
     def complete_todo(self, todo_id: int) -> Optional[TodoItem]:
         """Mark a todo as completed"""
         todo = self.get_todo(todo_id)
-        if todo:
+        if todo and not todo.completed:
             todo.complete()
-            self.save()
+            self._append('update', id=todo_id,
+                         fields={'completed': todo.completed, 'completed_at_ns': todo.completed_at_ns})
         return todo
     
     def uncomplete_todo(self, todo_id: int) -> Optional[TodoItem]:
         """Mark a todo as not completed"""
         todo = self.get_todo(todo_id)
-        if todo:
+        if todo and todo.completed:
             todo.uncomplete()
-            self.save()
+            self._append('update', id=todo_id,
+                         fields={'completed': todo.completed, 'completed_at_ns': todo.completed_at_ns})
         return todo
 
 
@@ -156,298 +484,317 @@ storage = TodoStorage()
 # Create the MCP server
 server = Server("todo-server")
 
+# Display symbols, built once instead of per formatted todo
+_PRIORITY_EMOJI = {"low": "🔵", "medium": "🟡", "high": "🔴"}
+_STATUS_ICON = ("○", "✓")  # indexed by TodoItem.completed
 
-@server.list_tools()
-async def handle_list_tools() -> List[types.Tool]:
-    """List available tools for the todo server"""
-    return [
-        types.Tool(
-            name="add_todo",
-            description="Add a new todo item",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "The title of the todo item"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Optional description of the todo item"
-                    },
-                    "priority": {
-                        "type": "string",
-                        "enum": ["low", "medium", "high"],
-                        "description": "Priority level of the todo item"
-                    }
+
+# Tool descriptors are constant, so they are built once at import time
+_TOOLS: List[types.Tool] = [
+    types.Tool(
+        name="add_todo",
+        description="Add a new todo item",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "The title of the todo item"
                 },
-                "required": ["title"]
-            }
-        ),
-        types.Tool(
-            name="list_todos",
-            description="List all todo items with optional filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "completed": {
-                        "type": "boolean",
-                        "description": "Filter by completion status (true/false)"
-                    },
-                    "priority": {
-                        "type": "string",
-                        "enum": ["low", "medium", "high"],
-                        "description": "Filter by priority level"
-                    }
-                }
-            }
-        ),
-        types.Tool(
-            name="get_todo",
-            description="Get a specific todo item by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "integer",
-                        "description": "The ID of the todo item"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Optional description of the todo item"
                 },
-                "required": ["id"]
-            }
-        ),
-        types.Tool(
-            name="update_todo",
-            description="Update a todo item",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "integer",
-                        "description": "The ID of the todo item"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New title for the todo item"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "New description for the todo item"
-                    },
-                    "priority": {
-                        "type": "string",
-                        "enum": ["low", "medium", "high"],
-                        "description": "New priority level"
-                    }
+                "priority": {
+                    "type": "string",
+                    "enum": ["low", "medium", "high"],
+                    "description": "Priority level of the todo item"
+                }
+            },
+            "required": ["title"]
+        }
+    ),
+    types.Tool(
+        name="list_todos",
+        description="List all todo items with optional filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "completed": {
+                    "type": "boolean",
+                    "description": "Filter by completion status (true/false)"
                 },
-                "required": ["id"]
+                "priority": {
+                    "type": "string",
+                    "enum": ["low", "medium", "high"],
+                    "description": "Filter by priority level"
+                }
             }
-        ),
-        types.Tool(
-            name="complete_todo",
-            description="Mark a todo item as completed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "integer",
-                        "description": "The ID of the todo item to complete"
-                    }
+        }
+    ),
+    types.Tool(
+        name="get_todo",
+        description="Get a specific todo item by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "integer",
+                    "description": "The ID of the todo item"
+                }
+            },
+            "required": ["id"]
+        }
+    ),
+    types.Tool(
+        name="update_todo",
+        description="Update a todo item",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "integer",
+                    "description": "The ID of the todo item"
                 },
-                "required": ["id"]
-            }
-        ),
-        types.Tool(
-            name="uncomplete_todo",
-            description="Mark a todo item as not completed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "integer",
-                        "description": "The ID of the todo item to uncomplete"
-                    }
+                "title": {
+                    "type": "string",
+                    "description": "New title for the todo item"
                 },
-                "required": ["id"]
-            }
-        ),
-        types.Tool(
-            name="delete_todo",
-            description="Delete a todo item",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "integer",
-                        "description": "The ID of the todo item to delete"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "New description for the todo item"
                 },
-                "required": ["id"]
-            }
-        )
+                "priority": {
+                    "type": "string",
+                    "enum": ["low", "medium", "high"],
+                    "description": "New priority level"
+                }
+            },
+            "required": ["id"]
+        }
+    ),
+    types.Tool(
+        name="complete_todo",
+        description="Mark a todo item as completed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "integer",
+                    "description": "The ID of the todo item to complete"
+                }
+            },
+            "required": ["id"]
+        }
+    ),
+    types.Tool(
+        name="uncomplete_todo",
+        description="Mark a todo item as not completed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "integer",
+                    "description": "The ID of the todo item to uncomplete"
+                }
+            },
+            "required": ["id"]
+        }
+    ),
+    types.Tool(
+        name="delete_todo",
+        description="Delete a todo item",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "integer",
+                    "description": "The ID of the todo item to delete"
+                }
+            },
+            "required": ["id"]
+        }
+    )
+]
+
+
+@server.list_tools()
+async def handle_list_tools() -> List[types.Tool]:
+    """List available tools for the todo server"""
+    return _TOOLS
+
+
+def _text(text: str) -> List[types.TextContent]:
+    """Wrap a response string in the content list returned to the client"""
+    return [types.TextContent(type="text", text=text)]
+
+
+@functools.lru_cache(maxsize=256)
+def _not_found_content(todo_id: int) -> types.TextContent:
+    """Not-found reply for a todo ID, built once per ID since clients often retry the same one"""
+    return types.TextContent(type="text", text=f"Todo item #{todo_id} not found")
+
+
+# Tool handlers, one per tool; each takes the call arguments and returns the response content
+def _handle_add_todo(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle the add_todo tool"""
+    title = arguments["title"]
+    description = arguments.get("description", "")
+    priority = arguments.get("priority", "medium")
+    
+    todo = storage.add_todo(title, description, priority)
+    return _text(f"Added todo item #{todo.id}: {todo.title}")
+
+
+def _handle_list_todos(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle the list_todos tool"""
+    completed = arguments.get("completed")
+    priority = arguments.get("priority")
+    
+    # Apply both filters in a single pass
+    todos = [
+        t for t in storage.iter_todos()
+        if (completed is None or t.completed == completed)
+        and (priority is None or t.priority == priority)
+    ]
+    
+    if not todos:
+        return _text("No todos found")
+    
+    # Format the todo list, header included, with a single join
+    todo_list = ["Todo List:"]
+    todo_list.extend(
+        f"{_STATUS_ICON[t.completed]} #{t.id} {_PRIORITY_EMOJI[t.priority]} {t.title}"
+        + (f"\n    {t.description}" if t.description else "")
+        for t in todos
+    )
+    
+    return _text("\n".join(todo_list))
+
+
+def _handle_get_todo(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle the get_todo tool"""
+    todo_id = arguments["id"]
+    todo = storage.get_todo(todo_id)
+    
+    if not todo:
+        return [_not_found_content(todo_id)]
+    
+    status = "Completed" if todo.completed else "Pending"
+    
+    details = [
+        f"Todo #{todo.id}",
+        f"Title: {todo.title}",
+        f"Description: {todo.description or 'None'}",
+        f"Status: {status}",
+        f"Priority: {_PRIORITY_EMOJI[todo.priority]} {todo.priority.title()}",
+        f"Created: {todo.created_at}"
     ]
+    
+    if todo.completed_at:
+        details.append(f"Completed: {todo.completed_at}")
+    
+    return _text("\n".join(details))
+
+
+def _handle_update_todo(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle the update_todo tool"""
+    todo_id = arguments["id"]
+    updates = {k: v for k, v in arguments.items() if k != "id"}
+    
+    todo = storage.update_todo(todo_id, **updates)
+    if not todo:
+        return [_not_found_content(todo_id)]
+    
+    return _text(f"Updated todo item #{todo.id}: {todo.title}")
+
+
+def _handle_complete_todo(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle the complete_todo tool"""
+    todo_id = arguments["id"]
+    todo = storage.complete_todo(todo_id)
+    
+    if not todo:
+        return [_not_found_content(todo_id)]
+    
+    return _text(f"Completed todo item #{todo.id}: {todo.title}")
+
+
+def _handle_uncomplete_todo(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle the uncomplete_todo tool"""
+    todo_id = arguments["id"]
+    todo = storage.uncomplete_todo(todo_id)
+    
+    if not todo:
+        return [_not_found_content(todo_id)]
+    
+    return _text(f"Uncompleted todo item #{todo.id}: {todo.title}")
+
+
+def _handle_delete_todo(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle the delete_todo tool"""
+    todo_id = arguments["id"]
+    success = storage.delete_todo(todo_id)
+    
+    if not success:
+        return [_not_found_content(todo_id)]
+    
+    return _text(f"Deleted todo item #{todo_id}")
+
+
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], List[types.TextContent]]] = {
+    "add_todo": _handle_add_todo,
+    "list_todos": _handle_list_todos,
+    "get_todo": _handle_get_todo,
+    "update_todo": _handle_update_todo,
+    "complete_todo": _handle_complete_todo,
+    "uncomplete_todo": _handle_uncomplete_todo,
+    "delete_todo": _handle_delete_todo,
+}
 
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Handle tool calls from the client"""
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return _text(f"Unknown tool: {name}")
     
-    if name == "add_todo":
-        title = arguments["title"]
-        description = arguments.get("description", "")
-        priority = arguments.get("priority", "medium")
-        
-        todo = storage.add_todo(title, description, priority)
-        return [types.TextContent(
-            type="text",
-            text=f"Added todo item #{todo.id}: {todo.title}"
-        )]
-    
-    elif name == "list_todos":
-        todos = storage.get_all_todos()
-        
-        # Apply filters
-        if "completed" in arguments:
-            todos = [t for t in todos if t.completed == arguments["completed"]]
-        if "priority" in arguments:
-            todos = [t for t in todos if t.priority == arguments["priority"]]
-        
-        if not todos:
-            return [types.TextContent(type="text", text="No todos found")]
-        
-        # Format the todo list
-        todo_list = []
-        for todo in todos:
-            status = "✓" if todo.completed else "○"
-            priority_emoji = {"low": "🔵", "medium": "🟡", "high": "🔴"}[todo.priority]
-            todo_list.append(f"{status} #{todo.id} {priority_emoji} {todo.title}")
-            if todo.description:
-                todo_list.append(f"    {todo.description}")
-        
-        return [types.TextContent(
-            type="text",
-            text="Todo List:\n" + "\n".join(todo_list)
-        )]
-    
-    elif name == "get_todo":
-        todo_id = arguments["id"]
-        todo = storage.get_todo(todo_id)
-        
-        if not todo:
-            return [types.TextContent(
-                type="text",
-                text=f"Todo item #{todo_id} not found"
-            )]
-        
-        status = "Completed" if todo.completed else "Pending"
-        priority_emoji = {"low": "🔵", "medium": "🟡", "high": "🔴"}[todo.priority]
-        
-        details = [
-            f"Todo #{todo.id}",
-            f"Title: {todo.title}",
-            f"Description: {todo.description or 'None'}",
-            f"Status: {status}",
-            f"Priority: {priority_emoji} {todo.priority.title()}",
-            f"Created: {todo.created_at}"
-        ]
-        
-        if todo.completed_at:
-            details.append(f"Completed: {todo.completed_at}")
-        
-        return [types.TextContent(
-            type="text",
-            text="\n".join(details)
-        )]
-    
-    elif name == "update_todo":
-        todo_id = arguments["id"]
-        updates = {k: v for k, v in arguments.items() if k != "id"}
-        
-        todo = storage.update_todo(todo_id, **updates)
-        if not todo:
-            return [types.TextContent(
-                type="text",
-                text=f"Todo item #{todo_id} not found"
-            )]
-        
-        return [types.TextContent(
-            type="text",
-            text=f"Updated todo item #{todo.id}: {todo.title}"
-        )]
-    
-    elif name == "complete_todo":
-        todo_id = arguments["id"]
-        todo = storage.complete_todo(todo_id)
-        
-        if not todo:
-            return [types.TextContent(
-                type="text",
-                text=f"Todo item #{todo_id} not found"
-            )]
-        
-        return [types.TextContent(
-            type="text",
-            text=f"Completed todo item #{todo.id}: {todo.title}"
-        )]
-    
-    elif name == "uncomplete_todo":
-        todo_id = arguments["id"]
-        todo = storage.uncomplete_todo(todo_id)
-        
-        if not todo:
-            return [types.TextContent(
-                type="text",
-                text=f"Todo item #{todo_id} not found"
-            )]
-        
-        return [types.TextContent(
-            type="text",
-            text=f"Uncompleted todo item #{todo.id}: {todo.title}"
-        )]
-    
-    elif name == "delete_todo":
-        todo_id = arguments["id"]
-        success = storage.delete_todo(todo_id)
-        
-        if not success:
-            return [types.TextContent(
-                type="text",
-                text=f"Todo item #{todo_id} not found"
-            )]
-        
-        return [types.TextContent(
-            type="text",
-            text=f"Deleted todo item #{todo_id}"
-        )]
-    
-    else:
-        return [types.TextContent(
-            type="text",
-            text=f"Unknown tool: {name}"
-        )]
+    return handler(arguments)
 
 
 async def main():
     """Main entry point for the server"""
-    # Run the server using stdio transport
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        # Create proper notification options for MCP 1.9.2
-        notification_options = NotificationOptions()
-        experimental_capabilities = {}
-        
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="todo-server",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=notification_options,
-                    experimental_capabilities=experimental_capabilities
+    # Keep journal writes off the request path while the server is running
+    storage.start_flusher()
+    try:
+        # Run the server using stdio transport
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            # Create proper notification options for MCP 1.9.2
+            notification_options = NotificationOptions()
+            experimental_capabilities = {}
+            
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="todo-server",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=notification_options,
+                        experimental_capabilities=experimental_capabilities
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        await storage.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop for the stdio transport when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())